@@ -9,11 +9,11 @@ doc = App.ActiveDocument
 if doc is None:
     doc = App.newDocument("Buckle_Sleeve_Enclosed")
 
-# Clean reruns
-for obj_name in ["BuckleSleeveEnclosed", "OuterBox", "InnerCavity"]:
+# Clean reruns: BuckleSleeveEnclosed is reused in place further down,
+# only leftover helper objects are removed here
+for obj_name in ["OuterBox", "InnerCavity"]:
     if doc.getObject(obj_name):
         doc.removeObject(obj_name)
-doc.recompute()
 
 # -----------------------------
 # Parameters (mm)
@@ -44,97 +44,99 @@ outer_d = inner_d + 2 * wall             # outer depth (X)
 # Build the sleeve using rounded rectangles
 # -----------------------------
 
-def make_rounded_box(length_x, width_y, height_z, corner_r):
-    """Create a box with rounded vertical corners (filleted edges)"""
+def make_rounded_box(length_x, width_y, height_z, corner_r, origin=(0, 0, 0)):
+    """Create a box with rounded vertical corners (filleted edges) at origin"""
+    base = App.Vector(*origin)
     # Clamp radius to max possible
     max_r = min(length_x, width_y) / 2 - 0.1
     r = min(corner_r, max_r) if corner_r > 0 else 0
     
     if r > 0:
-        # Create a 2D rounded rectangle and extrude it
-        # Build the profile with arcs at corners
-        import math
-        
-        # Corner centers
-        c1 = App.Vector(r, r, 0)                      # bottom-left
-        c2 = App.Vector(length_x - r, r, 0)          # bottom-right
-        c3 = App.Vector(length_x - r, width_y - r, 0) # top-right
-        c4 = App.Vector(r, width_y - r, 0)           # top-left
-        
-        # Create edges: lines and arcs
-        edges = []
-        
-        # Bottom edge
-        edges.append(Part.makeLine(App.Vector(r, 0, 0), App.Vector(length_x - r, 0, 0)))
-        # Bottom-right arc
-        edges.append(Part.makeCircle(r, c2, App.Vector(0, 0, 1), -90, 0))
-        # Right edge
-        edges.append(Part.makeLine(App.Vector(length_x, r, 0), App.Vector(length_x, width_y - r, 0)))
-        # Top-right arc
-        edges.append(Part.makeCircle(r, c3, App.Vector(0, 0, 1), 0, 90))
-        # Top edge
-        edges.append(Part.makeLine(App.Vector(length_x - r, width_y, 0), App.Vector(r, width_y, 0)))
-        # Top-left arc
-        edges.append(Part.makeCircle(r, c4, App.Vector(0, 0, 1), 90, 180))
-        # Left edge
-        edges.append(Part.makeLine(App.Vector(0, width_y - r, 0), App.Vector(0, r, 0)))
-        # Bottom-left arc
-        edges.append(Part.makeCircle(r, c1, App.Vector(0, 0, 1), 180, 270))
-        
-        wire = Part.Wire(edges)
-        face = Part.Face(wire)
-        solid = face.extrude(App.Vector(0, 0, height_z))
-        return solid
+        # Sharp rectangle inset by r, offset back out by r with arc joins:
+        # one offset call gives the rounded-rectangle profile
+        core = Part.makePolygon([
+            base + App.Vector(r, r, 0),
+            base + App.Vector(length_x - r, r, 0),
+            base + App.Vector(length_x - r, width_y - r, 0),
+            base + App.Vector(r, width_y - r, 0),
+            base + App.Vector(r, r, 0),
+        ])
+        face = Part.Face(core).makeOffset2D(r, join=0)
+        return face.extrude(App.Vector(0, 0, height_z))
     else:
-        return Part.makeBox(length_x, width_y, height_z)
+        return Part.makeBox(length_x, width_y, height_z, base)
+
+def split_rim_edges(shape, height_z):
+    """Classify the flat rim edges of shape into (top, bottom) in one pass"""
+    top_edges, bottom_edges = [], []
+    for edge in shape.Edges:
+        bbox = edge.BoundBox
+        # Rim edges are flat; vertical walls and seams fail on one field read
+        if bbox.ZLength >= 1.0:
+            continue
+        z_min, z_max = bbox.ZMin, bbox.ZMax
+        # Top edges are at Z = height_z, bottom edges at Z = 0
+        if abs(z_min - height_z) < 0.5 and abs(z_max - height_z) < 0.5:
+            top_edges.append(edge)
+        elif abs(z_min) < 0.5 and abs(z_max) < 0.5:
+            bottom_edges.append(edge)
+    return top_edges, bottom_edges
+
+def safe_fillet_r(r, max_r):
+    """Clamp a fillet radius so it cannot consume the faces next to the edge"""
+    return min(r, max_r - 0.01)
 
 # 1. Create outer shape with rounded corners
 outer = make_rounded_box(outer_d, outer_w, sleeve_height, outer_corner_radius)
 
 # 2. Create inner cavity with rounded corners (to match buckle!)
 #    Goes through BOTH top and bottom - it's a sleeve!
-inner = make_rounded_box(inner_d, inner_w, sleeve_height + 2.0, inner_corner_radius)
-inner.translate(App.Vector(wall, wall, -1.0))
-
-# 3. Cut cavity from outer
-shape = outer.cut(inner)
-
-# 4. Apply fillet to top rim edges
-if top_rim_radius > 0:
-    top_edges = []
-    for edge in shape.Edges:
-        bbox = edge.BoundBox
-        # Top edges are at Z = sleeve_height
-        if abs(bbox.ZMin - sleeve_height) < 0.5 and abs(bbox.ZMax - sleeve_height) < 0.5:
-            top_edges.append(edge)
-    
-    if top_edges:
-        try:
-            shape = shape.makeFillet(top_rim_radius, top_edges)
-        except Exception as e:
-            print(f"Fillet on top edges failed: {e}")
-            print("Continuing without top rim fillet...")
-
-# 5. Apply fillet to bottom rim edges
-if bottom_rim_radius > 0:
-    bottom_edges = []
-    for edge in shape.Edges:
-        bbox = edge.BoundBox
-        # Bottom edges are at Z = 0
-        if abs(bbox.ZMin) < 0.5 and abs(bbox.ZMax) < 0.5:
-            bottom_edges.append(edge)
-    
-    if bottom_edges:
+inner = make_rounded_box(inner_d, inner_w, sleeve_height + 2.0, inner_corner_radius,
+                         (wall, wall, -1.0))
+
+# 3. Cut cavity from outer, then merge any coplanar faces it leaves behind
+#    (once, before edge selection) so the fillet step sees fewer edges
+shape = outer.cut(inner).removeSplitter()
+
+# 4. Fillet top and bottom rim edges
+#    Rims that share a radius go through a single makeFillet call, so with
+#    equal radii the fillet topology is only rebuilt once.
+#    Each rim is only `wall` wide and is filleted on both its inner and outer
+#    edge (and each wall carries a top and a bottom fillet), so radii are
+#    clamped up front instead of letting OCC attempt and fail the fillet.
+max_rim_r = min(wall, sleeve_height) / 2
+top_r = safe_fillet_r(top_rim_radius, max_rim_r) if top_rim_radius > 0 else 0
+bottom_r = safe_fillet_r(bottom_rim_radius, max_rim_r) if bottom_rim_radius > 0 else 0
+if top_r != top_rim_radius or bottom_r != bottom_rim_radius:
+    print(f"Rim radii clamped to fit the {wall:.1f} mm wall: "
+          f"top {top_r:.2f} mm, bottom {bottom_r:.2f} mm")
+
+rim_radii = sorted({r for r in (top_r, bottom_r) if r > 0})
+
+for rim_radius in rim_radii:
+    top_edges, bottom_edges = split_rim_edges(shape, sleeve_height)
+    rim_edges = []
+    if top_r == rim_radius:
+        rim_edges += top_edges
+    if bottom_r == rim_radius:
+        rim_edges += bottom_edges
+
+    if rim_edges:
         try:
-            shape = shape.makeFillet(bottom_rim_radius, bottom_edges)
+            shape = shape.makeFillet(rim_radius, rim_edges)
         except Exception as e:
-            print(f"Fillet on bottom edges failed: {e}")
-            print("Continuing without bottom rim fillet...")
+            print(f"Fillet on rim edges (r={rim_radius}) failed: {e}")
+            print("Continuing without this rim fillet...")
 
 # -----------------------------
 # Create the FreeCAD object
 # -----------------------------
-sleeve_obj = doc.addObject("Part::Feature", "BuckleSleeveEnclosed")
+sleeve_obj = doc.getObject("BuckleSleeveEnclosed")
+if sleeve_obj is not None and sleeve_obj.TypeId != "Part::Feature":
+    doc.removeObject(sleeve_obj.Name)
+    sleeve_obj = None
+if sleeve_obj is None:
+    sleeve_obj = doc.addObject("Part::Feature", "BuckleSleeveEnclosed")
 sleeve_obj.Shape = shape
 
 doc.recompute()
@@ -5,6 +5,10 @@
 # No gussets (keeps window-closing clearance)
 # Fillet off by default to avoid OCC segfaults
 
+import hashlib
+import inspect
+import os
+
 import FreeCAD as App
 import Part
 from FreeCAD import Vector
@@ -46,6 +50,9 @@ CENTER_HOLES_Z = True
 
 FILLET_RADIUS = 0.0
 REFINE_AFTER_BOOLEANS = True
+FUSE_FUZZY_TOLERANCE = 1e-4  # mm; blocks share exact coplanar faces
+CACHE_BRACKET_BODY = False  # opt-in: reuse the fused body (BREP in the user cache dir) when only cut features change
+BODY_CACHE_PREFIX = "window_clip_v2_body"  # cache file prefix, distinct per macro
 
 # --------- COMPRESSION ZONE (CUT-IN POCKET) ---------
 POCKET_ENABLE_TOP = True
@@ -108,11 +115,11 @@ def safe_fillet(shape, radius):
     except Exception:
         pass
     try:
+        # Only long edges get filleted; one bbox lookup and one max() per
+        # edge (anything under the old 0.25mm skip fails this test anyway)
         edges = []
         for e in shape.Edges:
             bb = e.BoundBox
-            if bb.XLength < 0.25 and bb.YLength < 0.25 and bb.ZLength < 0.25:
-                continue
             if max(bb.XLength, bb.YLength, bb.ZLength) >= 15.0:
                 edges.append(e)
         if not edges:
@@ -129,10 +136,9 @@ def guy_y_positions():
         raise ValueError("Guy-hole Y margins too large for WIDTH.")
     return (min_y, max_y)
 
-def cut_top_guy_holes_in_lip(bracket):
+def top_guy_holes_in_lip(yL, yR):
     # Two holes through the lip thickness (drill along +Z)
     r = GUY_HOLE_DIAMETER / 2.0
-    yL, yR = guy_y_positions()
 
     # Lip is located at:
     # x = INSIDE_THICKNESS .. INSIDE_THICKNESS + LIP_LENGTH
@@ -147,44 +153,137 @@ def cut_top_guy_holes_in_lip(bracket):
     # Drill cylinder along Z, long enough to clear the lip
     drill_h = LIP_THICKNESS + 2.0
 
-    holes = [
+    return [
         Part.makeCylinder(r, drill_h, Vector(x_lip, yL, z_lip_bottom - 1.0), Vector(0, 0, 1)),
         Part.makeCylinder(r, drill_h, Vector(x_lip, yR, z_lip_bottom - 1.0), Vector(0, 0, 1)),
     ]
 
-    for h in holes:
-        bracket = bracket.cut(h)
-    return refine_if_enabled(bracket)
+def back_trim_boxes(trim_to_x, z_top_trim):
+    # The trim only applies to the inside arm, but it is cut after the fuse,
+    # so the boxes must stay clear of the blocks it never touched:
+    # - they start at z = HORIZONTAL_THICKNESS (top of the horizontal);
+    # - above the lip's underside they skip the lip's x range, so a trim
+    #   taller than the lip bottom can't notch the lip.
+    # The arm's back face is at x = 0, so the boxes only need to reach 1mm
+    # past it and past the sides.
+    z_lip_bottom = HORIZONTAL_THICKNESS + INSIDE_HEIGHT - LIP_THICKNESS
+    lip_x0 = INSIDE_THICKNESS
+    lip_x1 = INSIDE_THICKNESS + LIP_LENGTH
+
+    spans = [(-1.0, trim_to_x, HORIZONTAL_THICKNESS, min(z_top_trim, z_lip_bottom))]
+    if z_top_trim > z_lip_bottom:
+        z0 = max(HORIZONTAL_THICKNESS, z_lip_bottom)
+        spans.append((-1.0, min(trim_to_x, lip_x0), z0, z_top_trim))
+        spans.append((lip_x1, trim_to_x, z0, z_top_trim))
+
+    return [Part.makeBox(x1 - x0, WIDTH + 2.0, z1 - z0, Vector(x0, -1.0, z0))
+            for x0, x1, z0, z1 in spans
+            if x1 > x0 and z1 > z0]
 
-def cut_bottom_guy_holes(bracket):
+def bottom_guy_holes(yL, yR):
     r = GUY_HOLE_DIAMETER / 2.0
-    yL, yR = guy_y_positions()
 
     if GUY_BOTTOM_MODE == "outside_arm":
         z0 = -OUTSIDE_LENGTH + HORIZONTAL_THICKNESS
         z_bottom_hole = z0 + clamp(GUY_BOTTOM_Z_FRAC, 0.10, 0.95) * OUTSIDE_LENGTH
 
         xh = HORIZONTAL_LENGTH - OUTSIDE_THICKNESS - 0.5
-        holes = [
+        return [
             Part.makeCylinder(r, OUTSIDE_THICKNESS + 2.0, Vector(xh, yL, z_bottom_hole), Vector(1, 0, 0)),
             Part.makeCylinder(r, OUTSIDE_THICKNESS + 2.0, Vector(xh, yR, z_bottom_hole), Vector(1, 0, 0)),
         ]
-        for h in holes:
-            bracket = bracket.cut(h)
-        return refine_if_enabled(bracket)
 
     if GUY_BOTTOM_MODE == "horizontal":
         xh = HORIZONTAL_LENGTH - OUTSIDE_THICKNESS - clamp(GUY_BOTTOM_X_BACKOFF, 6.0, 40.0)
-        holes = [
+        return [
             Part.makeCylinder(r, HORIZONTAL_THICKNESS + 2.0, Vector(xh, yL, -1.0), Vector(0, 0, 1)),
             Part.makeCylinder(r, HORIZONTAL_THICKNESS + 2.0, Vector(xh, yR, -1.0), Vector(0, 0, 1)),
         ]
-        for h in holes:
-            bracket = bracket.cut(h)
-        return refine_if_enabled(bracket)
 
     raise ValueError('GUY_BOTTOM_MODE must be "outside_arm" or "horizontal".')
 
+def make_bracket_body(top_h, bot_h, conn_h):
+    inside_bottom = Part.makeBox(INSIDE_THICKNESS, WIDTH, bot_h,
+                                 Vector(INSIDE_FORWARD_SHIFT, 0, HORIZONTAL_THICKNESS))
+
+    inside_top = Part.makeBox(INSIDE_THICKNESS, WIDTH, top_h,
+                              Vector(0.0, 0, HORIZONTAL_THICKNESS + bot_h))
+
+    connector = Part.makeBox(INSIDE_FORWARD_SHIFT + INSIDE_THICKNESS, WIDTH, conn_h,
+                             Vector(0.0, 0, HORIZONTAL_THICKNESS + bot_h - conn_h))
+
+    clip_lip = Part.makeBox(LIP_LENGTH, WIDTH, LIP_THICKNESS, Vector(
+        INSIDE_THICKNESS,
+        0,
+        HORIZONTAL_THICKNESS + INSIDE_HEIGHT - LIP_THICKNESS
+    ))
+
+    horizontal_start_x = INSIDE_FORWARD_SHIFT
+    horizontal_actual_length = HORIZONTAL_LENGTH - INSIDE_FORWARD_SHIFT
+
+    horizontal = Part.makeBox(horizontal_actual_length, WIDTH, HORIZONTAL_THICKNESS,
+                              Vector(horizontal_start_x, 0, 0))
+
+    outside_arm = Part.makeBox(OUTSIDE_THICKNESS, WIDTH, OUTSIDE_LENGTH, Vector(
+        HORIZONTAL_LENGTH - OUTSIDE_THICKNESS,
+        0,
+        -OUTSIDE_LENGTH + HORIZONTAL_THICKNESS
+    ))
+
+    # All bracket blocks go through one multi-argument fuse. A small fuzzy
+    # value lets OCC snap the coincident faces instead of intersecting them.
+    return inside_bottom.fuse([inside_top, connector, horizontal, outside_arm, clip_lip],
+                              FUSE_FUZZY_TOLERANCE)
+
+def body_cache_dir():
+    # Per-user FreeCAD cache dir (user app data dir on versions without one),
+    # never the shared, world-writable temp dir
+    get_dir = getattr(App, "getUserCachePath", None) or App.getUserAppDataDir
+    path = os.path.join(get_dir(), "window_clip_bodies")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def load_or_build_bracket_body(top_h, bot_h, conn_h):
+    # The fused body only depends on the block dimensions and on
+    # make_bracket_body itself, so it is saved as a BREP in the user cache
+    # dir keyed on both; reruns that only change the trim, pockets or holes
+    # skip straight to the cut, and editing the builder invalidates old files.
+    # Only the latest body per macro is kept.
+    if not CACHE_BRACKET_BODY:
+        return make_bracket_body(top_h, bot_h, conn_h)
+
+    try:
+        builder_src = inspect.getsource(make_bracket_body)
+    except (OSError, TypeError):
+        # Source not available: we can't tell if a cached body is stale
+        return make_bracket_body(top_h, bot_h, conn_h)
+
+    key = repr((builder_src, top_h, bot_h, conn_h, INSIDE_HEIGHT, INSIDE_THICKNESS, INSIDE_FORWARD_SHIFT,
+                LIP_LENGTH, LIP_THICKNESS, HORIZONTAL_LENGTH, HORIZONTAL_THICKNESS,
+                OUTSIDE_LENGTH, OUTSIDE_THICKNESS, WIDTH, FUSE_FUZZY_TOLERANCE))
+    digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+    cache_dir = body_cache_dir()
+    file_name = f"{BODY_CACHE_PREFIX}_{digest}.brep"
+    path = os.path.join(cache_dir, file_name)
+
+    if os.path.exists(path):
+        try:
+            body = Part.read(path)
+            if body.isValid():
+                return body
+        except Exception:
+            pass
+
+    body = make_bracket_body(top_h, bot_h, conn_h)
+    try:
+        for old in os.listdir(cache_dir):
+            if old.startswith(BODY_CACHE_PREFIX + "_") and old != file_name:
+                os.remove(os.path.join(cache_dir, old))
+        body.exportBrep(path)
+    except Exception:
+        pass
+    return body
+
 def create_camera_mount():
     doc = App.ActiveDocument
     if doc is None:
@@ -192,19 +291,17 @@ def create_camera_mount():
 
     top_h = clamp(INSIDE_TOP_SEGMENT_HEIGHT, 1.0, INSIDE_HEIGHT)
     bot_h = max(0.1, INSIDE_HEIGHT - top_h)
+    conn_h = clamp(INSIDE_CONNECT_HEIGHT, 0.5, top_h)
 
-    inside_bottom = Part.makeBox(INSIDE_THICKNESS, WIDTH, bot_h)
-    inside_bottom.translate(Vector(INSIDE_FORWARD_SHIFT, 0, HORIZONTAL_THICKNESS))
-
-    inside_top = Part.makeBox(INSIDE_THICKNESS, WIDTH, top_h)
-    inside_top.translate(Vector(0.0, 0, HORIZONTAL_THICKNESS + bot_h))
+    # Checked here rather than in make_bracket_body so a cached body can't skip it
+    if HORIZONTAL_LENGTH - INSIDE_FORWARD_SHIFT <= 5.0:
+        raise ValueError("HORIZONTAL_LENGTH too small vs INSIDE_FORWARD_SHIFT.")
 
-    conn_h = clamp(INSIDE_CONNECT_HEIGHT, 0.5, top_h)
-    connector = Part.makeBox(INSIDE_FORWARD_SHIFT + INSIDE_THICKNESS, WIDTH, conn_h)
-    connector.translate(Vector(0.0, 0, HORIZONTAL_THICKNESS + bot_h - conn_h))
+    bracket = load_or_build_bracket_body(top_h, bot_h, conn_h)
 
-    inside_arm = inside_bottom.fuse(inside_top).fuse(connector)
-    inside_arm = refine_if_enabled(inside_arm)
+    # Every cutter (back trim, pockets, undercut, camera and guy holes) is
+    # collected here and removed with a single multi-tool cut
+    cutters = []
 
     if BACK_TRIM_ENABLE:
         trim_to_x = BACK_TRIM_TO_X - BACK_TRIM_EXTRA
@@ -213,37 +310,7 @@ def create_camera_mount():
         else:
             z_top_trim = HORIZONTAL_THICKNESS + bot_h
 
-        trim_box = Part.makeBox(400.0, WIDTH + 40.0, z_top_trim + 80.0)
-        trim_box.translate(Vector(-400.0, -20.0, -80.0))
-        trim_box.translate(Vector(trim_to_x, 0.0, 0.0))
-
-        inside_arm = inside_arm.cut(trim_box)
-        inside_arm = refine_if_enabled(inside_arm)
-
-    clip_lip = Part.makeBox(LIP_LENGTH, WIDTH, LIP_THICKNESS)
-    clip_lip.translate(Vector(
-        INSIDE_THICKNESS,
-        0,
-        HORIZONTAL_THICKNESS + INSIDE_HEIGHT - LIP_THICKNESS
-    ))
-
-    horizontal_start_x = INSIDE_FORWARD_SHIFT
-    horizontal_actual_length = HORIZONTAL_LENGTH - INSIDE_FORWARD_SHIFT
-    if horizontal_actual_length <= 5.0:
-        raise ValueError("HORIZONTAL_LENGTH too small vs INSIDE_FORWARD_SHIFT.")
-
-    horizontal = Part.makeBox(horizontal_actual_length, WIDTH, HORIZONTAL_THICKNESS)
-    horizontal.translate(Vector(horizontal_start_x, 0, 0))
-
-    outside_arm = Part.makeBox(OUTSIDE_THICKNESS, WIDTH, OUTSIDE_LENGTH)
-    outside_arm.translate(Vector(
-        HORIZONTAL_LENGTH - OUTSIDE_THICKNESS,
-        0,
-        -OUTSIDE_LENGTH + HORIZONTAL_THICKNESS
-    ))
-
-    bracket = inside_arm.fuse(horizontal).fuse(outside_arm).fuse(clip_lip)
-    bracket = refine_if_enabled(bracket)
+        cutters.extend(back_trim_boxes(trim_to_x, z_top_trim))
 
     # Compression pockets
     x0 = clamp(POCKET_X_START, 0.0, max(0.0, HORIZONTAL_LENGTH - 1.0))
@@ -257,16 +324,13 @@ def create_camera_mount():
     depth = clamp(POCKET_DEPTH, 0.1, max_depth_allowed)
 
     if POCKET_ENABLE_TOP:
-        top_pocket = Part.makeBox(pocket_len, pocket_w, depth)
-        top_pocket.translate(Vector(x0, y0, HORIZONTAL_THICKNESS - depth))
-        bracket = bracket.cut(top_pocket)
-        bracket = refine_if_enabled(bracket)
+        top_pocket = Part.makeBox(pocket_len, pocket_w, depth,
+                                  Vector(x0, y0, HORIZONTAL_THICKNESS - depth))
+        cutters.append(top_pocket)
 
     if POCKET_ENABLE_BOTTOM:
-        bottom_pocket = Part.makeBox(pocket_len, pocket_w, depth)
-        bottom_pocket.translate(Vector(x0, y0, 0.0))
-        bracket = bracket.cut(bottom_pocket)
-        bracket = refine_if_enabled(bracket)
+        bottom_pocket = Part.makeBox(pocket_len, pocket_w, depth, Vector(x0, y0, 0.0))
+        cutters.append(bottom_pocket)
 
     # Option B: Dedicated underside damping slot (long, wide cut)
     if UNDERCUT_ENABLE:
@@ -280,10 +344,8 @@ def create_camera_mount():
         umax_depth = max(0.1, HORIZONTAL_THICKNESS - UNDERCUT_MIN_FLOOR)
         udepth = clamp(UNDERCUT_DEPTH, 0.1, umax_depth)
 
-        undercut = Part.makeBox(ulen, uw, udepth)
-        undercut.translate(Vector(ux0, uy0, 0.0))  # bottom face
-        bracket = bracket.cut(undercut)
-        bracket = refine_if_enabled(bracket)
+        undercut = Part.makeBox(ulen, uw, udepth, Vector(ux0, uy0, 0.0))  # bottom face
+        cutters.append(undercut)
 
     # Camera mount holes (your original pair)
     xh = HORIZONTAL_LENGTH - OUTSIDE_THICKNESS - 1
@@ -303,20 +365,21 @@ def create_camera_mount():
     if SECOND_HOLE and y2 > max_y:
         raise ValueError(f"Hole 2 too close to edge (y2={y2:.2f}, max={max_y:.2f}).")
 
-    holes = [Part.makeCylinder(hole_r, OUTSIDE_THICKNESS + 2, Vector(xh, y1, zh), Vector(1, 0, 0))]
+    cutters.append(Part.makeCylinder(hole_r, OUTSIDE_THICKNESS + 2, Vector(xh, y1, zh), Vector(1, 0, 0)))
     if SECOND_HOLE:
-        holes.append(Part.makeCylinder(hole_r, OUTSIDE_THICKNESS + 2, Vector(xh, y2, zh), Vector(1, 0, 0)))
-
-    for h in holes:
-        bracket = bracket.cut(h)
-    bracket = refine_if_enabled(bracket)
+        cutters.append(Part.makeCylinder(hole_r, OUTSIDE_THICKNESS + 2, Vector(xh, y2, zh), Vector(1, 0, 0)))
 
-    # Guy-wire holes
-    if GUY_ENABLE and GUY_TOP_IN_LIP:
-        bracket = cut_top_guy_holes_in_lip(bracket)
+    # Guy-wire holes (top and bottom pairs share the same Y positions)
     if GUY_ENABLE:
-        bracket = cut_bottom_guy_holes(bracket)
+        guy_y = guy_y_positions()
+        if GUY_TOP_IN_LIP:
+            cutters.extend(top_guy_holes_in_lip(*guy_y))
+        cutters.extend(bottom_guy_holes(*guy_y))
+
+    bracket = bracket.cut(cutters)
 
+    # Merge the coplanar faces left by all of the booleans above in one pass
+    bracket = refine_if_enabled(bracket)
     bracket = safe_fillet(bracket, FILLET_RADIUS)
 
     mount = doc.addObject("Part::Feature", "WindowCameraMount")
@@ -0,0 +1,239 @@
+# Shared geometry for the TPU damping strip macros.
+# The TPU_Damping_Strips_* macros only hold their parameters in a CFG dict and
+# call build_tpu_strips(CFG); everything else lives here.
+#
+# STRIP_MODE picks the second TPU solid:
+#   "long_under" - long strip under the horizontal (original mount)
+#   "undercut"   - strip for the Option B underside slot (v2 mount)
+
+import functools
+import hashlib
+
+import FreeCAD as App
+import Part  # provides the Part::Box feature type
+
+# doc.Meta key prefix for the hash of the CFG a macro's features were built
+# from; the macro's PARAMS_NAME is appended so each macro has its own entry
+PARAMS_HASH_KEY = "tpu_params_hash"
+
+# Each macro owns a parameter carrier object (CFG["PARAMS_NAME"]) and its two
+# boxes (CFG["PAD_NAME"], CFG["STRIP_NAME"]). A box's size and position are
+# expressions on the carrier's "Pad*" / "Strip*" properties, so editing one
+# value in the document only recomputes that box, and one macro never
+# touches another macro's features.
+BOX_PROPERTIES = (
+    ("Length", "App::PropertyLength", "Length"),
+    ("Width", "App::PropertyLength", "Width"),
+    ("Height", "App::PropertyLength", "Height"),
+    ("X", "App::PropertyDistance", "Placement.Base.x"),
+    ("Y", "App::PropertyDistance", "Placement.Base.y"),
+    ("Z", "App::PropertyDistance", "Placement.Base.z"),
+)
+
+def clamp(v, lo, hi):
+    return max(lo, min(hi, v))
+
+def ensure_doc():
+    doc = App.ActiveDocument
+    if doc is None:
+        doc = App.newDocument("TPU_Strips")
+    return doc
+
+def pocket_insert_geometry(cfg):
+    pocket_len = clamp(cfg["POCKET_LENGTH"], 1.0, cfg["HORIZONTAL_LENGTH"])
+    pocket_w = clamp(cfg["WIDTH"] - 2.0 * cfg["POCKET_Y_MARGIN"], 1.0, cfg["WIDTH"])
+    t = clamp(cfg["TPU_POCKET_THICKNESS"], 0.2, cfg["POCKET_DEPTH"])
+
+    # This places it into the TOP pocket area
+    z_floor = cfg["HORIZONTAL_THICKNESS"] - cfg["POCKET_DEPTH"]
+    return (cfg["POCKET_X_START"], cfg["POCKET_Y_MARGIN"], z_floor), (pocket_len, pocket_w, t)
+
+def long_under_strip_geometry(cfg):
+    horizontal_actual_length = cfg["HORIZONTAL_LENGTH"] - cfg["INSIDE_FORWARD_SHIFT"]
+    if horizontal_actual_length <= 0:
+        raise ValueError("HORIZONTAL_LENGTH must be > INSIDE_FORWARD_SHIFT.")
+
+    strip_len = clamp(cfg["TPU_STRIP_LENGTH"], 5.0, horizontal_actual_length)
+    strip_w = clamp(cfg["TPU_STRIP_WIDTH"], 5.0, cfg["WIDTH"])
+    strip_t = clamp(cfg["TPU_STRIP_THICKNESS"], 0.2, 5.0)
+
+    if cfg["CENTER_STRIP_IN_X"]:
+        x = cfg["INSIDE_FORWARD_SHIFT"] + (horizontal_actual_length - strip_len) / 2.0
+    else:
+        x = cfg["INSIDE_FORWARD_SHIFT"] + 2.0
+
+    if cfg["CENTER_STRIP_IN_Y"]:
+        y = (cfg["WIDTH"] - strip_w) / 2.0
+    else:
+        y = 2.0
+
+    z = -strip_t
+    return (x, y, z), (strip_len, strip_w, strip_t)
+
+def undercut_strip_geometry(cfg):
+    if not cfg["UNDERCUT_ENABLE"]:
+        raise ValueError("UNDERCUT_ENABLE is False in this TPU macro. Enable it to generate the underside strip.")
+
+    horizontal_actual_length = cfg["HORIZONTAL_LENGTH"] - cfg["INSIDE_FORWARD_SHIFT"]
+    if horizontal_actual_length <= 0:
+        raise ValueError("HORIZONTAL_LENGTH must be > INSIDE_FORWARD_SHIFT.")
+
+    # Match slot dims by default
+    if cfg["TPU_UNDERCUT_MATCH_SLOT"]:
+        strip_len = clamp(cfg["UNDERCUT_LENGTH"], 5.0, horizontal_actual_length)
+        strip_w = clamp(cfg["WIDTH"] - 2.0 * cfg["UNDERCUT_Y_MARGIN"], 5.0, cfg["WIDTH"])
+    else:
+        strip_len = clamp(cfg["TPU_STRIP_LENGTH"], 5.0, horizontal_actual_length)
+        strip_w = clamp(cfg["TPU_STRIP_WIDTH"], 5.0, cfg["WIDTH"])
+
+    strip_t = clamp(cfg["TPU_UNDERCUT_STRIP_THICKNESS"], 0.2, cfg["UNDERCUT_DEPTH"])
+
+    # Place strip into the underside slot region:
+    # Slot is cut from z=0 upward by UNDERCUT_DEPTH, starting at (UNDERCUT_X_START, UNDERCUT_Y_MARGIN, 0)
+    if cfg["CENTER_STRIP_IN_X"]:
+        # Center within the horizontal run (not typical for matching slot)
+        x = cfg["INSIDE_FORWARD_SHIFT"] + (horizontal_actual_length - strip_len) / 2.0
+    else:
+        x = clamp(cfg["UNDERCUT_X_START"], 0.0, cfg["HORIZONTAL_LENGTH"] - strip_len)
+
+    if cfg["CENTER_STRIP_IN_Y"]:
+        y = (cfg["WIDTH"] - strip_w) / 2.0
+    else:
+        y = clamp(cfg["UNDERCUT_Y_MARGIN"], 0.0, cfg["WIDTH"] - strip_w)
+
+    # Put it flush to the underside (z=0..strip_t). This makes it easy to export/print as a "pad".
+    z = 0.0
+    return (x, y, z), (strip_len, strip_w, strip_t)
+
+STRIP_GEOMETRY = {
+    "long_under": long_under_strip_geometry,
+    "undercut": undercut_strip_geometry,
+}
+
+# Pure-Python sizes and positions, keyed on the frozen CFG items. The driver
+# macros reload this module on every run, which empties the cache; unchanged
+# reruns are caught earlier by the doc.Meta hash in build_tpu_strips.
+@functools.lru_cache(maxsize=None)
+def _compute_geometry(cfg_items):
+    cfg = dict(cfg_items)
+    mode = cfg["STRIP_MODE"]
+    if mode not in STRIP_GEOMETRY:
+        raise ValueError(f'STRIP_MODE must be one of {sorted(STRIP_GEOMETRY)}, got "{mode}".')
+    return pocket_insert_geometry(cfg), STRIP_GEOMETRY[mode](cfg)
+
+def ensure_params(doc, params_name):
+    params = doc.getObject(params_name)
+    if params is None:
+        params = doc.addObject("App::FeaturePython", params_name)
+    for prefix in ("Pad", "Strip"):
+        for suffix, prop_type, _ in BOX_PROPERTIES:
+            if not hasattr(params, prefix + suffix):
+                params.addProperty(prop_type, prefix + suffix, "TPU")
+    return params
+
+def set_box_params(params, prefix, origin, dims):
+    # BOX_PROPERTIES is ordered Length, Width, Height, X, Y, Z
+    for (suffix, _, _), value in zip(BOX_PROPERTIES, tuple(dims) + tuple(origin)):
+        setattr(params, prefix + suffix, value)
+
+def box_expressions(params_name, prefix):
+    return {path: f"{params_name}.{prefix}{suffix}" for suffix, _, path in BOX_PROPERTIES}
+
+def is_bound_box(box, params_name, prefix):
+    # True if box is a Part::Box whose size and placement still follow the
+    # carrier's properties (a deleted carrier or cleared expression fails)
+    if box is None or box.TypeId != "Part::Box":
+        return False
+    # ExpressionEngine reports multi-component paths on the object itself
+    # with a leading dot (".Placement.Base.x"), single ones without ("Length")
+    bound = {path.lstrip("."): expr for path, expr in box.ExpressionEngine}
+    return all(bound.get(path) == expr
+               for path, expr in box_expressions(params_name, prefix).items())
+
+def get_or_add_box(doc, name, params, prefix):
+    # Parametric Part::Box: the document stores Length/Width/Height and the
+    # placement, and the BRep is generated on recompute instead of saved.
+    # An existing box is reused; anything else under the name is replaced.
+    box = doc.getObject(name)
+    if box is not None and box.TypeId != "Part::Box":
+        doc.removeObject(box.Name)
+        box = None
+    if box is None:
+        box = doc.addObject("Part::Box", name)
+    for path, expr in box_expressions(params.Name, prefix).items():
+        box.setExpression(path, expr)
+    return box
+
+def place_side_by_side(pad_dims, cfg):
+    # Both parts are plain boxes, so their extents are known from the dims:
+    # pad minimum at the origin (clean layout), strip to the right of the pad
+    # with a gap. Returns the two box origins; no BoundBox or translate needed.
+    dx = pad_dims[0] + cfg["PREVIEW_GAP"] + cfg["PREVIEW_PAD"]
+    return (0.0, 0.0, 0.0), (dx, 0.0, 0.0)
+
+def fit_view(cfg):
+    # Only the side-by-side preview needs the view reset; in the real mount
+    # positions layout the user's current view is left alone (no redraw)
+    if App.GuiUp and cfg["PREVIEW_MODE_SIDE_BY_SIDE"]:
+        import FreeCADGui
+        FreeCADGui.ActiveDocument.ActiveView.viewIsometric()
+        FreeCADGui.ActiveDocument.ActiveView.fitAll()
+        FreeCADGui.updateGui()
+
+def build_tpu_strips(cfg):
+    doc = ensure_doc()
+
+    params_name = cfg["PARAMS_NAME"]
+    hash_key = f"{PARAMS_HASH_KEY}:{params_name}"
+    cfg_items = tuple(sorted(cfg.items()))
+    params_hash = hashlib.blake2b(repr(cfg_items).encode(), digest_size=8).hexdigest()
+    params, pad, strip = (doc.getObject(name)
+                          for name in (params_name, cfg["PAD_NAME"], cfg["STRIP_NAME"]))
+
+    # Rerun with unchanged parameters: the carrier and both boxes are still
+    # there and still linked, so the features in the document are current
+    if (params is not None
+            and is_bound_box(pad, params_name, "Pad")
+            and is_bound_box(strip, params_name, "Strip")
+            and doc.Meta.get(hash_key) == params_hash):
+        fit_view(cfg)
+        print("TPU strips unchanged; parameters match the existing features.")
+        return pad.Shape, strip.Shape
+
+    (pad_origin, pad_dims), (strip_origin, strip_dims) = _compute_geometry(cfg_items)
+
+    if cfg["PREVIEW_MODE_SIDE_BY_SIDE"]:
+        pad_origin, strip_origin = place_side_by_side(pad_dims, cfg)
+
+    # Update (or create) the parameter carrier and the two linked boxes as
+    # one undo step, then recompute only them, not the whole document
+    doc.openTransaction("TPU strips")
+    try:
+        params = ensure_params(doc, params_name)
+        set_box_params(params, "Pad", pad_origin, pad_dims)
+        set_box_params(params, "Strip", strip_origin, strip_dims)
+
+        tpu1 = get_or_add_box(doc, cfg["PAD_NAME"], params, "Pad")
+        tpu2 = get_or_add_box(doc, cfg["STRIP_NAME"], params, "Strip")
+
+        meta = doc.Meta
+        meta[hash_key] = params_hash
+        doc.Meta = meta
+    except Exception:
+        doc.abortTransaction()
+        raise
+    doc.commitTransaction()
+
+    doc.recompute([params, tpu1, tpu2], True, True)
+
+    fit_view(cfg)
+
+    print("TPU strips created:")
+    print("  {}: {:.2f} x {:.2f} x {:.2f} mm".format(cfg["PAD_NAME"], *pad_dims))
+    print("  {}: {:.2f} x {:.2f} x {:.2f} mm".format(cfg["STRIP_NAME"], *strip_dims))
+    if cfg["STRIP_MODE"] == "undercut":
+        print(f"  Undercut match slot: {cfg['TPU_UNDERCUT_MATCH_SLOT']}")
+    print(f"  Preview side-by-side: {cfg['PREVIEW_MODE_SIDE_BY_SIDE']}")
+    print(f"  Sizes/positions editable on {params.Name} (Pad*, Strip*)")
+
+    return tpu1.Shape, tpu2.Shape
@@ -125,44 +125,81 @@ def create_document():
     return App.newDocument(doc_name)
 
 
+# One cylinder per (radius, height); make_cylinder hands out translated
+# copies that share its geometry instead of building a new primitive.
+_cyl_cache = {}
+
+
 def make_cylinder(radius, height, position=(0, 0, 0)):
-    cyl = Part.makeCylinder(radius, height)
-    cyl.translate(App.Vector(*position))
-    return cyl
+    key = (round(radius, 4), round(height, 4))
+    base = _cyl_cache.get(key)
+    if base is None:
+        base = _cyl_cache[key] = Part.makeCylinder(radius, height)
+    return base.translated(App.Vector(*position))
+
+
+def revolve_profile(rz_points, position=(0, 0, 0), angle=360):
+    """Revolve a closed (r, z) polyline around the Z axis through position."""
+    base = App.Vector(*position)
+    points = [base + App.Vector(r, 0, z) for r, z in rz_points]
+    profile = Part.makePolygon(points + points[:1])
+    return Part.Face(profile).revolve(base, App.Vector(0, 0, 1), angle)
 
 
 def make_tube(outer_r, inner_r, height, position=(0, 0, 0)):
-    """Create hollow cylinder. Outer - inner."""
-    outer = make_cylinder(outer_r, height, position)
-    inner = make_cylinder(inner_r, height + 2, 
-                          (position[0], position[1], position[2] - 1))
-    return outer.cut(inner)
+    """Create hollow cylinder by revolving its wall cross-section (no boolean)."""
+    return revolve_profile([(inner_r, 0), (outer_r, 0),
+                            (outer_r, height), (inner_r, height)], position)
+
+
+def make_centered_rect(dx, dy, z=0):
+    """Closed rectangular wire, dx by dy, centered on the Z axis at height z."""
+    corners = [(-dx/2, -dy/2), (dx/2, -dy/2), (dx/2, dy/2), (-dx/2, dy/2), (-dx/2, -dy/2)]
+    return Part.makePolygon([App.Vector(x, y, z) for x, y in corners])
 
 
 def make_dome(radius, height, position=(0, 0, 0)):
-    sphere = Part.makeSphere(radius)
-    mat = App.Matrix()
-    mat.scale(1, 1, height / radius)
-    sphere = sphere.transformGeometry(mat)
-    box = Part.makeBox(radius * 3, radius * 3, radius * 2)
-    box.translate(App.Vector(-radius * 1.5, -radius * 1.5, -radius * 2))
-    sphere = sphere.cut(box)
-    sphere.translate(App.Vector(*position))
-    return sphere
+    """Half-ellipsoid dome: quarter-ellipse profile revolved around Z."""
+    base = App.Vector(*position)
+    rim = base + App.Vector(radius, 0, 0)
+    apex = base + App.Vector(0, 0, height)
+    # Part.Ellipse(S1, S2, Center) takes the major axis through S1
+    if radius >= height:
+        ellipse = Part.Ellipse(rim, apex, base)
+    else:
+        ellipse = Part.Ellipse(apex, rim, base)
+    arc = Part.ArcOfEllipse(ellipse, 0, math.pi / 2).toShape()
+    profile = Part.Wire([arc, Part.makeLine(apex, base), Part.makeLine(base, rim)])
+    return Part.Face(profile).revolve(base, App.Vector(0, 0, 1), 360)
+
+
+# Every section (and cap) uses the same key and keyway, only at a different
+# height; build each once at z = 0 and hand out translated copies.
+_key_cache = {}
 
 
 def add_alignment_key(shape, radius, length, z_pos, is_male=True):
     """Add key (protrusion) or keyway (slot)."""
+    # Key/clearance sizes are module globals that can change between runs
+    cache_key = (is_male, round(radius, 4), round(length, 4),
+                 KEY_WIDTH, KEY_DEPTH, JOINT_CLEARANCE)
+    template = _key_cache.get(cache_key)
+    if template is None:
+        if is_male:
+            template = Part.makeBox(KEY_WIDTH, KEY_DEPTH, length,
+                                    App.Vector(-KEY_WIDTH/2, radius - KEY_DEPTH, 0))
+        else:
+            clearance = JOINT_CLEARANCE * 2
+            template = Part.makeBox(KEY_WIDTH + clearance, KEY_DEPTH + clearance, length + 1,
+                                    App.Vector(-(KEY_WIDTH + clearance)/2,
+                                               radius - KEY_DEPTH - JOINT_CLEARANCE, -0.5))
+        _key_cache[cache_key] = template
+    
+    tool = template.translated(App.Vector(0, 0, z_pos))
     if is_male:
-        key = Part.makeBox(KEY_WIDTH, KEY_DEPTH, length)
-        key.translate(App.Vector(-KEY_WIDTH/2, radius - KEY_DEPTH, z_pos))
-        return shape.fuse(key)
+        return shape.fuse(tool)
     else:
-        clearance = JOINT_CLEARANCE * 2
-        slot = Part.makeBox(KEY_WIDTH + clearance, KEY_DEPTH + clearance, length + 1)
-        slot.translate(App.Vector(-(KEY_WIDTH + clearance)/2,
-                                   radius - KEY_DEPTH - JOINT_CLEARANCE, z_pos - 0.5))
-        return shape.cut(slot)
+        return shape.cut(tool)
 
 
 def add_part_to_doc(doc, shape, name, color=(0.7, 0.7, 0.7)):
@@ -183,40 +220,36 @@ def create_tube_section(section_num, is_sleeve_section=False, is_feedpoint_secti
     """
     length = ACTUAL_SECTION_LENGTH
     
-    # --- MAIN TUBE ---
-    main_tube = make_tube(OUTER_R, INNER_R, length)
-    
-    # --- FEMALE SOCKET AT TOP (z = length - JOINT_LENGTH to z = length) ---
     female_r = INNER_R + JOINT_CLEARANCE
-    female_socket = make_cylinder(female_r, JOINT_LENGTH + 0.1, 
-                                   (0, 0, length - JOINT_LENGTH))
-    main_tube = main_tube.cut(female_socket)
-    
-    # Female entrance chamfer (cone at z = length, opening outward)
-    # Cone goes from female_r+CHAMFER at top to female_r at bottom
-    chamfer_cone = Part.makeCone(female_r + CHAMFER_SIZE, female_r, CHAMFER_SIZE)
-    chamfer_cone.translate(App.Vector(0, 0, length - CHAMFER_SIZE))
-    main_tube = main_tube.cut(chamfer_cone)
+    male_outer_r = INNER_R - JOINT_CLEARANCE
+    male_inner_r = INNER_R - WALL_THICKNESS
+    # The male plug sits inside INNER_R, so a short shoulder at the bottom
+    # of the bore is what joins the plug wall to the tube wall.
+    shoulder_z = WALL_THICKNESS
+    
+    # --- MAIN TUBE + JOINTS ---
+    # Tube wall, female socket (z = length - JOINT_LENGTH to z = length) and
+    # male plug (z = -JOINT_LENGTH to z = 0) as one (r, z) profile revolved
+    # around Z. Both lead-in chamfers are 45 degree steps in the profile.
+    main_tube = revolve_profile([
+        (male_inner_r, -JOINT_LENGTH),                  # male plug free end
+        (male_outer_r - CHAMFER_SIZE, -JOINT_LENGTH),   # male tip chamfer
+        (male_outer_r, -JOINT_LENGTH + CHAMFER_SIZE),
+        (male_outer_r, 0),
+        (OUTER_R, 0),
+        (OUTER_R, length),
+        (female_r + CHAMFER_SIZE, length),              # female entrance chamfer
+        (female_r, length - CHAMFER_SIZE),
+        (female_r, length - JOINT_LENGTH),              # female socket floor
+        (INNER_R, length - JOINT_LENGTH),
+        (INNER_R, shoulder_z),
+        (male_inner_r, shoulder_z),
+    ])
     
     # Female keyway
     main_tube = add_alignment_key(main_tube, female_r, KEY_LENGTH,
                                    length - JOINT_LENGTH + 1, is_male=False)
     
-    # --- MALE PLUG AT BOTTOM (z = -JOINT_LENGTH to z = 0) ---
-    male_outer_r = INNER_R - JOINT_CLEARANCE
-    male_inner_r = INNER_R - WALL_THICKNESS
-    
-    male_plug = make_tube(male_outer_r, male_inner_r, JOINT_LENGTH, 
-                          (0, 0, -JOINT_LENGTH))
-    
-    # Male tip chamfer - at the FREE END which is z = -JOINT_LENGTH
-    # Cone tapers from (male_outer_r - CHAMFER) at bottom to male_outer_r at top
-    tip_chamfer = Part.makeCone(male_outer_r - CHAMFER_SIZE, male_outer_r, CHAMFER_SIZE)
-    tip_chamfer.translate(App.Vector(0, 0, -JOINT_LENGTH))
-    male_plug = male_plug.cut(tip_chamfer)
-    
-    main_tube = main_tube.fuse(male_plug)
-    
     # Male key (on the plug exterior)
     main_tube = add_alignment_key(main_tube, male_outer_r - 0.3, KEY_LENGTH,
                                    -JOINT_LENGTH + 1, is_male=True)
@@ -250,19 +283,21 @@ def create_tube_section(section_num, is_sleeve_section=False, is_feedpoint_secti
         groove_depth = 2.0
         
         # Tube cutter: removes annular ring
-        groove_cutter = make_tube(OUTER_R + 0.1, OUTER_R - groove_depth,
-                                   groove_height, (0, 0, groove_z))
-        main_tube = main_tube.cut(groove_cutter)
+        cutters = [make_tube(OUTER_R + 0.1, OUTER_R - groove_depth,
+                             groove_height, (0, 0, groove_z))]
         
         # Triple indicator marks (shallow grooves)
         for i in range(3):
             mark_z = groove_z - 5 - (i * 4)
             if mark_z > JOINT_LENGTH + 5:
-                mark_cutter = make_tube(OUTER_R + 0.1, OUTER_R - 0.5,
-                                        1.5, (0, 0, mark_z))
-                main_tube = main_tube.cut(mark_cutter)
+                cutters.append(make_tube(OUTER_R + 0.1, OUTER_R - 0.5,
+                                         1.5, (0, 0, mark_z)))
+        
+        # Groove and marks are disjoint rings: cut them in one boolean
+        main_tube = main_tube.cut(cutters)
     
-    return main_tube
+    # Merge coplanar faces left by the booleans, once, at the very end
+    return main_tube.removeSplitter()
 
 
 # =============================================================================
@@ -273,52 +308,52 @@ def create_bottom_cap():
     """Bottom cap with coax exit, drain holes, cable anchor."""
     height = BOTTOM_CAP_HEIGHT
     
-    # Solid cap body
-    cap = make_cylinder(OUTER_R, height)
-    
-    # --- MALE PLUG ON TOP (z = height to z = height + JOINT_LENGTH) ---
     male_outer_r = INNER_R - JOINT_CLEARANCE
     male_inner_r = INNER_R - WALL_THICKNESS
     
-    male_plug = make_tube(male_outer_r, male_inner_r, JOINT_LENGTH, (0, 0, height))
-    
-    # Male tip chamfer - FREE END is at z = height + JOINT_LENGTH
-    # Cone tapers from (male_outer_r - CHAMFER) at top to male_outer_r at bottom
-    tip_chamfer = Part.makeCone(male_outer_r, male_outer_r - CHAMFER_SIZE, CHAMFER_SIZE)
-    tip_chamfer.translate(App.Vector(0, 0, height + JOINT_LENGTH - CHAMFER_SIZE))
-    male_plug = male_plug.cut(tip_chamfer)
-    
-    cap = cap.fuse(male_plug)
+    # --- SOLID CAP BODY + MALE PLUG ON TOP (z = height to z = height + JOINT_LENGTH) ---
+    # One revolved profile; the tip chamfer at the FREE END
+    # (z = height + JOINT_LENGTH) is a 45 degree step on the plug exterior
+    cap = revolve_profile([
+        (0, 0),
+        (OUTER_R, 0),
+        (OUTER_R, height),
+        (male_outer_r, height),
+        (male_outer_r, height + JOINT_LENGTH - CHAMFER_SIZE),
+        (male_outer_r - CHAMFER_SIZE, height + JOINT_LENGTH),
+        (male_inner_r, height + JOINT_LENGTH),
+        (male_inner_r, height),
+        (0, height),
+    ])
     
     # Male key
     cap = add_alignment_key(cap, male_outer_r - 0.3, KEY_LENGTH, height + 1, is_male=True)
     
-    # --- INTERNAL CAVITY ---
-    cavity_r = male_inner_r
-    cavity = make_cylinder(cavity_r, height - WALL_THICKNESS + JOINT_LENGTH,
-                           (0, 0, WALL_THICKNESS))
-    cap = cap.cut(cavity)
-    
-    # --- COAX EXIT WITH BOSS ---
+    # --- COAX EXIT BOSS ---
     boss_r = COAX_HOLE_DIA / 2 + 3
     boss_length = 5
     
-    # Build boss at origin, rotate, translate
-    boss = Part.makeCylinder(boss_r, boss_length)
-    boss.rotate(App.Vector(0, 0, 0), App.Vector(0, 1, 0), 90)
-    boss.translate(App.Vector(-OUTER_R - boss_length, 0, height / 2))
+    # Build boss in place, pointing along +X
+    boss = Part.makeCylinder(boss_r, boss_length,
+                             App.Vector(-OUTER_R - boss_length, 0, height / 2),
+                             App.Vector(1, 0, 0))
     cap = cap.fuse(boss)
     
+    # --- INTERNAL CAVITY + COAX ROUTING ---
+    # Everything hollowed out of the cap body goes through one boolean
+    cavity_r = male_inner_r
+    cavity = make_cylinder(cavity_r, height - WALL_THICKNESS + JOINT_LENGTH,
+                           (0, 0, WALL_THICKNESS))
+    
     # Coax hole through everything
-    coax_hole = Part.makeCylinder(COAX_HOLE_DIA / 2, OUTER_R + boss_length + 5)
-    coax_hole.rotate(App.Vector(0, 0, 0), App.Vector(0, 1, 0), 90)
-    coax_hole.translate(App.Vector(-OUTER_R - boss_length - 2, 0, height / 2))
-    cap = cap.cut(coax_hole)
+    coax_hole = Part.makeCylinder(COAX_HOLE_DIA / 2, OUTER_R + boss_length + 5,
+                                  App.Vector(-OUTER_R - boss_length - 2, 0, height / 2),
+                                  App.Vector(1, 0, 0))
     
     # Vertical coax routing
     coax_up = make_cylinder(COAX_HOLE_DIA / 2, JOINT_LENGTH + height,
                             (0, 0, WALL_THICKNESS))
-    cap = cap.cut(coax_up)
+    cap = cap.cut([cavity, coax_hole, coax_up])
     
     # --- CABLE TIE ANCHOR ---
     anchor_width = 10
@@ -326,25 +361,28 @@ def create_bottom_cap():
     anchor_thickness = 3
     anchor_z = height - 6
     
-    anchor = Part.makeBox(anchor_width, anchor_span, anchor_thickness)
-    anchor.translate(App.Vector(-anchor_width/2, -anchor_span/2, anchor_z))
-    
     # Tie slot
     slot_width = anchor_width - 4
-    slot = Part.makeBox(slot_width, 4, anchor_thickness + 2)
-    slot.translate(App.Vector(-slot_width/2, -2, anchor_z - 1))
-    anchor = anchor.cut(slot)
+    slot_span = 4
+    
+    # Anchor plate outline with the tie slot as an inner wire, extruded once
+    anchor_face = Part.makeFace([make_centered_rect(anchor_width, anchor_span, anchor_z),
+                                 make_centered_rect(slot_width, slot_span, anchor_z)],
+                                "Part::FaceMakerBullseye")
+    anchor = anchor_face.extrude(App.Vector(0, 0, anchor_thickness))
     
     cap = cap.fuse(anchor)
     
     # --- DRAIN HOLES ---
-    for i in range(NUM_DRAIN_HOLES):
-        angle = i * (360 / NUM_DRAIN_HOLES) + 45
-        rad = math.radians(angle)
-        x = (OUTER_R - WALL_THICKNESS) * math.cos(rad)
-        y = (OUTER_R - WALL_THICKNESS) * math.sin(rad)
-        drain = make_cylinder(DRAIN_HOLE_DIA / 2, WALL_THICKNESS + 2, (x, y, -1))
-        cap = cap.cut(drain)
+    # All drains go into a single multi-tool cut instead of one cut per hole
+    drain_r = OUTER_R - WALL_THICKNESS
+    drain_step = 2 * math.pi / NUM_DRAIN_HOLES
+    drain_offset = math.radians(45)
+    drains = [make_cylinder(DRAIN_HOLE_DIA / 2, WALL_THICKNESS + 2,
+                            (drain_r * math.cos(drain_offset + i * drain_step),
+                             drain_r * math.sin(drain_offset + i * drain_step), -1))
+              for i in range(NUM_DRAIN_HOLES)]
+    cap = cap.cut(drains)
     
     return cap
 
@@ -364,14 +402,15 @@ def create_top_cap():
     cap = cap.fuse(dome)
     
     # --- FEMALE SOCKET AT BOTTOM ---
+    # Revolved cutter; the entrance chamfer is its 45 degree flare at z = 0
     female_r = INNER_R + JOINT_CLEARANCE
-    female_socket = make_cylinder(female_r, JOINT_LENGTH + 1, (0, 0, -1))
-    cap = cap.cut(female_socket)
-    
-    # Female entrance chamfer
-    chamfer_cone = Part.makeCone(female_r + CHAMFER_SIZE, female_r, CHAMFER_SIZE)
-    chamfer_cone.translate(App.Vector(0, 0, -CHAMFER_SIZE))
-    cap = cap.cut(chamfer_cone)
+    female_socket = revolve_profile([
+        (0, -1),
+        (female_r + CHAMFER_SIZE + 1, -1),
+        (female_r, CHAMFER_SIZE),
+        (female_r, JOINT_LENGTH),
+        (0, JOINT_LENGTH),
+    ])
     
     # Female keyway
     cap = add_alignment_key(cap, female_r, KEY_LENGTH, 1, is_male=False)
@@ -379,13 +418,12 @@ def create_top_cap():
     # --- INTERNAL CAVITY (solid top for weather seal) ---
     cavity_height = height - WALL_THICKNESS * 2
     cavity = make_cylinder(INNER_R - WALL_THICKNESS, cavity_height, (0, 0, JOINT_LENGTH))
-    cap = cap.cut(cavity)
     
     # --- RADIATOR WIRE EXIT (small hole at apex) ---
     wire_hole_dia = 4.0
     wire_hole = make_cylinder(wire_hole_dia / 2, WALL_THICKNESS * 2 + DOME_HEIGHT + 1,
                               (0, 0, height - WALL_THICKNESS))
-    cap = cap.cut(wire_hole)
+    cap = cap.cut([female_socket, cavity, wire_hole])
     
     return cap
 
@@ -402,13 +440,13 @@ def create_coax_guide():
     
     ring = make_tube(guide_or, guide_ir, guide_height)
     
-    # Flex slots
-    for i in range(3):
-        angle = i * 120
-        slot = Part.makeBox(3.0, guide_or * 2.5, guide_height + 2)
-        slot.translate(App.Vector(-1.5, -guide_or * 1.25, -1))
-        slot.rotate(App.Vector(0, 0, 0), App.Vector(0, 0, 1), angle)
-        ring = ring.cut(slot)
+    # Flex slots, removed in a single cut: one slot built in place, then
+    # rotated copies of it (a single transform each)
+    slot = Part.makeBox(3.0, guide_or * 2.5, guide_height + 2,
+                        App.Vector(-1.5, -guide_or * 1.25, -1))
+    slots = [slot.rotated(App.Vector(0, 0, 0), App.Vector(0, 0, 1), i * 120)
+             for i in range(3)]
+    ring = ring.cut(slots)
     
     return ring
 
@@ -419,21 +457,30 @@ def create_feedpoint_clamp():
     clamp_ir = SLEEVE_CHANNEL_R + 0.3
     clamp_height = 12.0
     
-    clamp = make_tube(clamp_or, clamp_ir, clamp_height)
-    
-    # Split
-    split = Part.makeBox(2.0, clamp_or * 2, clamp_height + 2)
-    split.translate(App.Vector(-1.0, 0, -1))
-    clamp = clamp.cut(split)
-    
-    # Bolt holes
+    split_half = 1.0
+    
+    # Ring with the 2mm split along +Y drawn straight into the outline:
+    # outer arc the long way round, down one side of the split, inner arc
+    # back, up the other side. One extrusion, no tube or split booleans.
+    y_out = math.sqrt(clamp_or ** 2 - split_half ** 2)
+    y_in = math.sqrt(clamp_ir ** 2 - split_half ** 2)
+    corners = [App.Vector(split_half, y_out, 0), App.Vector(-split_half, y_out, 0),
+               App.Vector(-split_half, y_in, 0), App.Vector(split_half, y_in, 0)]
+    outline = Part.Wire([
+        Part.Arc(corners[0], App.Vector(0, -clamp_or, 0), corners[1]).toShape(),
+        Part.makeLine(corners[1], corners[2]),
+        Part.Arc(corners[2], App.Vector(0, -clamp_ir, 0), corners[3]).toShape(),
+        Part.makeLine(corners[3], corners[0]),
+    ])
+    clamp = Part.Face(outline).extrude(App.Vector(0, 0, clamp_height))
+    
+    # Bolt holes, all in one cut
     bolt_r = 1.6  # M3 clearance
-    for z in [clamp_height * 0.25, clamp_height * 0.75]:
-        for y_sign in [1, -1]:
-            hole = Part.makeCylinder(bolt_r, 20)
-            hole.rotate(App.Vector(0, 0, 0), App.Vector(1, 0, 0), 90)
-            hole.translate(App.Vector(0, y_sign * (clamp_or - 2), z))
-            clamp = clamp.cut(hole)
+    holes = [Part.makeCylinder(bolt_r, 20, App.Vector(0, y_sign * (clamp_or - 2), z),
+                               App.Vector(0, -1, 0))
+             for z in [clamp_height * 0.25, clamp_height * 0.75]
+             for y_sign in [1, -1]]
+    clamp = clamp.cut(holes)
     
     return clamp
 
@@ -444,24 +491,31 @@ def create_sleeve_gauge():
     thickness = 3
     length = QUARTER_WAVE + 30
     
-    gauge = Part.makeBox(width, length, thickness)
-    
-    # Notch at nominal
-    n1 = Part.makeBox(width + 2, 2, 1.5)
-    n1.translate(App.Vector(-1, QUARTER_WAVE_NOMINAL, thickness - 1.2))
-    gauge = gauge.cut(n1)
-    
-    # Notch at cut length
-    n2 = Part.makeBox(width + 2, 3, 2)
-    n2.translate(App.Vector(-1, QUARTER_WAVE, thickness - 1.8))
-    gauge = gauge.cut(n2)
-    
-    # Start mark
-    n0 = Part.makeBox(width + 2, 2, 1)
-    n0.translate(App.Vector(-1, 5, thickness - 0.8))
-    gauge = gauge.cut(n0)
-    
-    return gauge
+    # Notches across the full width: (start y, span, depth)
+    notches = [
+        (5, 2, 0.8),                     # start mark
+        (QUARTER_WAVE_NOMINAL, 2, 1.2),  # nominal
+        (QUARTER_WAVE, 3, 1.8),          # cut length
+    ]
+    
+    # Side (y, z) profile with the notches stepped into its top edge, then a
+    # single extrusion across the width instead of a box and three cuts.
+    # Each span between notch edges sits at the depth of the deepest notch
+    # covering it.
+    ys = sorted({0, length} | {min(max(y, 0), length)
+                               for y0, span, _ in notches for y in (y0, y0 + span)})
+    top = []
+    for y_lo, y_hi in zip(ys, ys[1:]):
+        depth = max([d for y0, span, d in notches if y0 < y_hi and y0 + span > y_lo] + [0])
+        z = thickness - depth
+        if top and top[-1][1] == z:
+            top[-1] = (y_hi, z)
+        else:
+            top += [(y_lo, z), (y_hi, z)]
+    
+    points = [App.Vector(0, y, z) for y, z in [(0, 0), (length, 0)] + top[::-1]]
+    profile = Part.Face(Part.makePolygon(points + points[:1]))
+    return profile.extrude(App.Vector(width, 0, 0))
 
 
 # =============================================================================
@@ -470,6 +524,9 @@ def create_sleeve_gauge():
 
 def main():
     validate_parameters()
+    # Shape caches are module-level; start each run from empty ones
+    _cyl_cache.clear()
+    _key_cache.clear()
     
     print("=" * 70)
     print("VHF AIRBAND FLOWERPOT ANTENNA v4")
@@ -489,52 +546,62 @@ def main():
     spacing = 50
     z = 0
     
-    # Bottom cap
-    print("Creating: Bottom Cap")
-    bc = create_bottom_cap()
-    bc.translate(App.Vector(0, 0, z))
-    add_part_to_doc(doc, bc, "BottomCap", (0.2, 0.6, 0.2))
-    z += BOTTOM_CAP_HEIGHT + JOINT_LENGTH + spacing
-    
-    # Sections
-    for i in range(NUM_SECTIONS):
-        is_sleeve = i < SLEEVE_SECTIONS
-        is_fp = i == SLEEVE_SECTIONS - 1
+    # Hold off recomputes while the parts are added; the document is
+    # recomputed once, after the last object is in
+    doc.RecomputesFrozen = True
+    try:
+        # Bottom cap
+        print("Creating: Bottom Cap")
+        bc = create_bottom_cap()
+        bc.translate(App.Vector(0, 0, z))
+        add_part_to_doc(doc, bc, "BottomCap", (0.2, 0.6, 0.2))
+        z += BOTTOM_CAP_HEIGHT + JOINT_LENGTH + spacing
+        
+        # Sections. Only the sleeve and feedpoint flags change a section's
+        # geometry, so each kind is built once and placed as translated copies
+        section_shapes = {}
+        for i in range(NUM_SECTIONS):
+            is_sleeve = i < SLEEVE_SECTIONS
+            is_fp = i == SLEEVE_SECTIONS - 1
+            
+            name = f"Section_{i+1:02d}"
+            if is_sleeve:
+                name += "_Sleeve"
+            if is_fp:
+                name += "_FP"
+            
+            print(f"Creating: {name}")
+            kind = (is_sleeve, is_fp)
+            if kind not in section_shapes:
+                section_shapes[kind] = create_tube_section(i, is_sleeve, is_fp)
+            sec = section_shapes[kind].translated(App.Vector(0, 0, z))
+            
+            color = (0.9, 0.5, 0.1) if is_fp else (0.2, 0.4, 0.7) if is_sleeve else (0.5, 0.7, 0.9)
+            add_part_to_doc(doc, sec, name, color)
+            z += ACTUAL_SECTION_LENGTH + spacing
+        
+        # Top cap
+        print("Creating: Top Cap")
+        tc = create_top_cap()
+        tc.translate(App.Vector(0, 0, z))
+        add_part_to_doc(doc, tc, "TopCap", (0.8, 0.2, 0.2))
         
-        name = f"Section_{i+1:02d}"
-        if is_sleeve:
-            name += "_Sleeve"
-        if is_fp:
-            name += "_FP"
+        # Accessories
+        print("Creating: Accessories")
+        guide = create_coax_guide()
+        for i in range(4):
+            g = guide.translated(App.Vector(60, i * 20, 0))
+            add_part_to_doc(doc, g, f"CoaxGuide_{i+1}", (0.9, 0.9, 0.3))
         
-        print(f"Creating: {name}")
-        sec = create_tube_section(i, is_sleeve, is_fp)
-        sec.translate(App.Vector(0, 0, z))
+        clamp = create_feedpoint_clamp()
+        clamp.translate(App.Vector(60, 100, 0))
+        add_part_to_doc(doc, clamp, "FeedpointClamp", (0.9, 0.5, 0.1))
         
-        color = (0.9, 0.5, 0.1) if is_fp else (0.2, 0.4, 0.7) if is_sleeve else (0.5, 0.7, 0.9)
-        add_part_to_doc(doc, sec, name, color)
-        z += ACTUAL_SECTION_LENGTH + spacing
-    
-    # Top cap
-    print("Creating: Top Cap")
-    tc = create_top_cap()
-    tc.translate(App.Vector(0, 0, z))
-    add_part_to_doc(doc, tc, "TopCap", (0.8, 0.2, 0.2))
-    
-    # Accessories
-    print("Creating: Accessories")
-    for i in range(4):
-        g = create_coax_guide()
-        g.translate(App.Vector(60, i * 20, 0))
-        add_part_to_doc(doc, g, f"CoaxGuide_{i+1}", (0.9, 0.9, 0.3))
-    
-    clamp = create_feedpoint_clamp()
-    clamp.translate(App.Vector(60, 100, 0))
-    add_part_to_doc(doc, clamp, "FeedpointClamp", (0.9, 0.5, 0.1))
-    
-    gauge = create_sleeve_gauge()
-    gauge.translate(App.Vector(100, 0, 0))
-    add_part_to_doc(doc, gauge, "SleeveGauge", (0.6, 0.6, 0.6))
+        gauge = create_sleeve_gauge()
+        gauge.translate(App.Vector(100, 0, 0))
+        add_part_to_doc(doc, gauge, "SleeveGauge", (0.6, 0.6, 0.6))
+    finally:
+        doc.RecomputesFrozen = False
     
     doc.recompute()
     